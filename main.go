@@ -102,7 +102,9 @@ func main() {
 	
 	// CLI mode flags
 	headless := flag.Bool("headless", false, "Run in headless CLI mode (no web server)")
-	ipaPath := flag.String("ipa", "", "IPA file path (required for headless mode)")
+	ipaPath := flag.String("ipa", "", "IPA file path (required for headless mode unless -ipa-list is used)")
+	ipaList := flag.String("ipa-list", "", "File with newline-separated IPA paths to sign in one run (headless mode, used with -output-dir)")
+	outputDir := flag.String("output-dir", "", "Output folder for signed IPAs when using -ipa-list")
 	profileName := flag.String("profile", "", "Profile name from data/profiles/ (required for headless mode)")
 	outputPath := flag.String("output", "", "Output path for signed IPA (required for headless mode)")
 	signArgs := flag.String("args", "", "Signing arguments (optional, e.g., '-a -d')")
@@ -129,6 +131,32 @@ func main() {
 		config.Current.ServerUrl = getPublicUrlFatal(&tunnel.Cloudflare{Host: *cloudflaredHost})
 	}
 
+	if *headless && *ipaList != "" {
+		// CLI batch mode
+		if *profileName == "" || *outputDir == "" {
+			log.Fatal().Msg("headless mode with -ipa-list requires -profile and -output-dir flags")
+		}
+
+		opts := signing.CLISigningOptions{
+			ProfileName:  *profileName,
+			SignArgs:     *signArgs,
+			UserBundleID: *userBundleID,
+			BuilderID:    *builderID,
+		}
+
+		failed, err := signing.RunCLIBatchSigning(*ipaList, *outputDir, opts)
+		if err != nil {
+			log.Fatal().Err(err).Msg("CLI batch signing failed")
+		}
+		if failed > 0 {
+			log.Error().Int("failed", failed).Msg("CLI batch signing finished with failures")
+			os.Exit(1)
+		}
+
+		log.Info().Str("output_dir", *outputDir).Msg("CLI batch signing completed successfully")
+		os.Exit(0)
+	}
+
 	if *headless {
 		// CLI mode
 		if *ipaPath == "" || *profileName == "" || *outputPath == "" {
@@ -0,0 +1,20 @@
+"""
+Optional native build of watch_folder.py with mypyc.
+
+    pip3 install mypy
+    python3 setup.py build_ext --inplace
+
+This places a compiled watch_folder extension module next to watch_folder.py;
+running `python3 watch_folder.py` then automatically uses it. Delete the
+generated .so file to go back to the pure-Python version. A .so that is older
+than watch_folder.py is ignored, so rebuild after editing the script.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="watch-folder",
+    py_modules=[],
+    ext_modules=mypycify(["--ignore-missing-imports", "watch_folder.py"]),
+)
@@ -30,6 +30,50 @@ func RunCLISigning(opts CLISigningOptions) error {
 	// Load storage
 	storage.Load()
 
+	return runCLISigning(opts)
+}
+
+// RunCLIBatchSigning signs every IPA listed in listFile (one path per line) in a single process,
+// saving each one as <name>_signed.ipa in outputDir. A result line is printed to stdout for every IPA:
+// "signed\t<ipa>\t<output>" or "failed\t<ipa>\t<error>". Returns the number of IPAs that failed.
+func RunCLIBatchSigning(listFile string, outputDir string, opts CLISigningOptions) (int, error) {
+	data, err := os.ReadFile(listFile)
+	if err != nil {
+		return 0, errors.WithMessage(err, "read IPA list file")
+	}
+	if err := os.MkdirAll(outputDir, 0755); err != nil {
+		return 0, errors.WithMessage(err, "create output directory")
+	}
+
+	// Load storage once for the whole batch
+	storage.Load()
+
+	failed := 0
+	for _, line := range strings.Split(string(data), "\n") {
+		ipaPath := strings.TrimRight(line, "\r")
+		if ipaPath == "" {
+			continue
+		}
+
+		fileOpts := opts
+		fileOpts.IPAFile = ipaPath
+		baseName := strings.TrimSuffix(filepath.Base(ipaPath), filepath.Ext(ipaPath))
+		fileOpts.OutputPath = filepath.Join(outputDir, baseName+"_signed.ipa")
+
+		if err := runCLISigning(fileOpts); err != nil {
+			log.Error().Err(err).Str("ipa", ipaPath).Msg("CLI signing failed")
+			fmt.Printf("failed\t%s\t%s\n", ipaPath, strings.ReplaceAll(err.Error(), "\n", " "))
+			failed++
+			continue
+		}
+		fmt.Printf("signed\t%s\t%s\n", ipaPath, fileOpts.OutputPath)
+	}
+
+	return failed, nil
+}
+
+// runCLISigning signs a single IPA file, assuming storage has already been loaded
+func runCLISigning(opts CLISigningOptions) error {
 	// Get profile
 	profile, ok := storage.Profiles.GetById(opts.ProfileName)
 	if !ok {
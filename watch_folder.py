@@ -6,15 +6,197 @@ Automatically signs IPA files when they are added to a watch folder.
 """
 
 import os
+import errno
+import stat
 import sys
 import time
 import subprocess
 import shutil
 import argparse
+import importlib
+import importlib.machinery
+import importlib.util
 import json
+import select
+import signal
+import struct
+import tempfile
+import atexit
+import functools
+import threading
+from collections import deque, OrderedDict
+import ctypes
+import ctypes.util
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, IO, Callable, Iterator, Any, NoReturn, Deque, Set
+
+try:
+    # Optional: native file system events (FSEvents on macOS, kqueue on BSD) on non-Linux platforms
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object  # type: ignore[misc,assignment]
+    Observer = None  # type: ignore[misc,assignment]
+
+try:
+    # Optional: faster JSON parsing for the config file
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+try:
+    # Optional (Linux): batch the per-scan stat() calls into one io_uring submission
+    import liburing
+except ImportError:
+    liburing = None  # type: ignore[assignment]
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson if it is installed, otherwise with the json module."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# inotify constants (see <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+SIGN_TIMEOUT = 1800  # seconds allowed per IPA (30 minutes)
+KILL_GRACE_PERIOD = 10  # seconds between terminate() and kill() on timeout
+OUTPUT_TAIL_LINES = 20  # lines of SignTools output repeated in failure messages
+MAX_PROCESSED = 10_000  # claimed files remembered before the least recently seen is forgotten
+# SignTools exit codes for a run stopped by Ctrl+C (SIGINT reaches the whole process group) or terminated
+INTERRUPTED_RETURNCODES = (-signal.SIGINT, -signal.SIGTERM)
+# Go's flag package error (with exit code 2) from SignTools builds that predate -ipa-list
+UNKNOWN_IPA_LIST_FLAG = "flag provided but not defined: -ipa-list"
+
+FileKey = Tuple[int, int]  # (st_dev, st_ino)
+# (st_size, mtime in ns) compared between scans; exact st_mtime_ns from stat(), float-derived via io_uring
+StatKey = Tuple[int, int]
+STATX_RING_ENTRIES = 64  # io_uring submission queue size used for batched stats
+
+# Details logged after a "SignTools executable not found" error
+_NOT_FOUND_MSG = (
+    "Searched in:",
+    "  1. Explicitly specified path (config/argument)",
+    "  2. SIGNTOOLS_PATH environment variable",
+    "  3. Script directory",
+    "  4. Parent directory (project root)",
+    "  5. Project root (detected by signer-cfg.yml or go.mod)",
+    "  6. PATH environment variable",
+    "  7. Current working directory",
+    "",
+    "Please specify the path using one of the following methods:",
+    "  - Set SIGNTOOLS_PATH environment variable",
+    "  - Add 'sign_tools_path' to config file",
+    "  - Use --sign-tools-path argument",
+)
+
+# SignTools executable locations checked inside each search directory
+SIGN_TOOLS_NAMES = (
+    Path("SignTools"),
+    Path("SignTools.app") / "Contents" / "MacOS" / "SignTools.bin",
+    Path("SignTools.app") / "Contents" / "MacOS" / "SignTools",
+)
+
+class IpaEventHandler(FileSystemEventHandler):
+    """watchdog event handler that flags any change to an .ipa file in the watch folder."""
+    
+    def __init__(self, changed: threading.Event) -> None:
+        super().__init__()
+        self.changed = changed
+    
+    def on_any_event(self, event: Any) -> None:
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(os.fsdecode(p).endswith(".ipa") for p in paths):
+            self.changed.set()
+
+
+class StatxBatch:
+    """Stat many files in one directory with batched io_uring IORING_OP_STATX requests.
+    With sqpoll the ring uses IORING_SETUP_SQPOLL: a kernel thread picks up submissions, so only waiting
+    for completions enters the kernel. The thread parks after the kernel's default idle time (the binding
+    cannot set sq_thread_idle)."""
+    
+    def __init__(self, entries: int = STATX_RING_ENTRIES, sqpoll: bool = False) -> None:
+        self.entries = entries
+        self.ring = liburing.Ring()
+        self.sqpoll = False
+        if sqpoll:
+            try:
+                liburing.io_uring_queue_init(entries, self.ring, liburing.IORING_SETUP_SQPOLL)
+                self.sqpoll = True
+            except OSError:
+                # SQPOLL needs CAP_SYS_ADMIN on kernels older than 5.11
+                self.ring = liburing.Ring()
+        if not self.sqpoll:
+            liburing.io_uring_queue_init(entries, self.ring)
+        self.cqe = liburing.Cqe()
+    
+    def stat(self, dir_fd: int, names: List[str]) -> List[Optional[Tuple[FileKey, StatKey]]]:
+        """Return ((dev, ino), (size, mtime)) for each name relative to dir_fd, or None if it failed.
+        Names the binding cannot pass to the kernel (not valid UTF-8) are stat'ed with os.stat() instead."""
+        results: List[Optional[Tuple[FileKey, StatKey]]] = [None] * len(names)
+        mask = liburing.STATX_SIZE | liburing.STATX_MTIME | liburing.STATX_INO
+        
+        for start in range(0, len(names), self.entries):
+            chunk = names[start:start + self.entries]
+            bufs: List[Optional[Any]] = []
+            for i, name in enumerate(chunk):
+                sqe = liburing.io_uring_get_sqe(self.ring)
+                buf = liburing.Statx()
+                try:
+                    liburing.io_uring_prep_statx(sqe, buf, name, mask=mask, dfd=dir_fd)
+                except UnicodeEncodeError:
+                    # scandir() returns undecodable names with surrogate escapes, which the binding rejects.
+                    # Submit a no-op in this slot so the ring stays consistent, and stat the file directly
+                    liburing.io_uring_prep_nop(sqe)
+                    buf = None
+                    try:
+                        st = os.stat(name, dir_fd=dir_fd)
+                        results[start + i] = ((st.st_dev, st.st_ino), (st.st_size, st.st_mtime_ns))
+                    except OSError:
+                        pass
+                liburing.io_uring_sqe_set_data64(sqe, i)
+                bufs.append(buf)
+            
+            if self.sqpoll:
+                # The SQ thread picks the entries up; io_uring_wait_cqe() below blocks as needed
+                liburing.io_uring_submit(self.ring)
+            else:
+                liburing.io_uring_submit_and_wait(self.ring, len(chunk))
+            for _ in chunk:
+                liburing.io_uring_wait_cqe(self.ring, self.cqe)
+                cqe = self.cqe[0]
+                try:
+                    # The binding raises the negated errno of a failed statx here
+                    cqe.res
+                except OSError:
+                    # Failed entries (e.g. the file was just moved out) are left as None
+                    pass
+                else:
+                    buf = bufs[cqe.user_data]
+                    if buf is not None:
+                        # The binding only exposes mtime as a float, so this is not exact nanoseconds.
+                        # It is the same for an unchanged file, which is all the stability check needs
+                        results[start + cqe.user_data] = (
+                            (os.makedev(buf.dev_major, buf.dev_minor), buf.ino),
+                            (buf.size, int(buf.mtime * 1_000_000_000)),
+                        )
+                finally:
+                    liburing.io_uring_cq_advance(self.ring, 1)
+        return results
+    
+    def close(self) -> None:
+        liburing.io_uring_queue_exit(self.ring)
+
 
 class WatchFolderSigner:
     def __init__(
@@ -29,6 +211,10 @@ class WatchFolderSigner:
         log_file: Optional[str] = None,
         poll_interval: float = 2.0,
         sign_tools_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        force_polling: bool = False,
+        sqpoll: bool = False,
     ):
         self.watch_folder = Path(watch_folder).expanduser().resolve()
         self.output_folder = Path(output_folder).expanduser().resolve()
@@ -40,9 +226,31 @@ class WatchFolderSigner:
         self.log_file = Path(log_file).expanduser().resolve() if log_file else None
         self.poll_interval = poll_interval
         self.sign_tools_path = Path(sign_tools_path).expanduser().resolve() if sign_tools_path else None
+        self.max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+        self.batch_size = max(1, batch_size if batch_size is not None else 10)
+        self.force_polling = force_polling
+        self.sqpoll = sqpoll
+        
+        # Resolved SignTools executable, cached by find_sign_tools()
+        self._sign_tools_cached: Optional[Path] = None
+        
+        # Worker pool used to run several SignTools processes at once (created in run())
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # SignTools processes currently running in worker threads, terminated on a second Ctrl+C
+        self._running: "Set[subprocess.Popen[bytes]]" = set()
+        self._running_lock = threading.Lock()
+        # Set by run() once it is shutting down; interrupted files are then left in the watch folder
+        self._stopping = False
+        # Claimed files waiting to be dispatched by flush_batch()
+        self._batch: List[Path] = []
+        # (size, mtime) of unclaimed files seen in the previous scan, used to detect stable files
+        self._pending_stats: Dict[Path, StatKey] = {}
+        # io_uring stat batcher, if liburing is available (created in run())
+        self._statx: Optional[StatxBatch] = None
         
-        # Track processed files to avoid reprocessing
-        self.processed_files = set()
+        # Track processed files to avoid reprocessing, keyed by (dev, inode) in LRU order
+        self.processed_files: "OrderedDict[FileKey, Path]" = OrderedDict()
+        self._processed_lock = threading.Lock()
         
         # Ensure directories exist
         self.watch_folder.mkdir(parents=True, exist_ok=True)
@@ -51,105 +259,209 @@ class WatchFolderSigner:
             self.processed_folder.mkdir(parents=True, exist_ok=True)
         if self.failed_folder:
             self.failed_folder.mkdir(parents=True, exist_ok=True)
+        
+        # (second, formatted timestamp) of the last log line, reused within the same second
+        self._ts_cache: Tuple[int, str] = (0, "")
+        
+        # Keep the log file open (line-buffered) instead of reopening it for every message
+        self._log_lock = threading.Lock()
+        self._log_fh: Optional[IO[str]] = None
+        if self.log_file:
+            try:
+                self._log_fh = open(self.log_file, "a", encoding="utf-8", buffering=1)
+                atexit.register(self.close_log)
+            except Exception as e:
+                print(f"Failed to open log file: {e}")
+    
+    def close_log(self) -> None:
+        """Close the log file if it is open."""
+        with self._log_lock:
+            if self._log_fh:
+                self._log_fh.close()
+                self._log_fh = None
     
-    def log(self, message: str, level: str = "INFO"):
+    def log(self, message: str, level: str = "INFO") -> None:
         """Log a message to console and optionally to a file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = int(time.time())
+        ts_sec, timestamp = self._ts_cache
+        if now != ts_sec:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._ts_cache = (now, timestamp)
         log_message = f"[{timestamp}] [{level}] {message}"
-        print(log_message)
+        sys.stdout.write(log_message + "\n")
         
-        if self.log_file:
+        if self._log_fh:
             try:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(log_message + "\n")
+                with self._log_lock:
+                    if self._log_fh:
+                        self._log_fh.write(log_message + "\n")
             except Exception as e:
                 print(f"Failed to write to log file: {e}")
     
     def find_sign_tools(self) -> Optional[Path]:
-        """Find the SignTools executable."""
+        """Find the SignTools executable, reusing the previously found path if there is one."""
+        if not self._sign_tools_cached:
+            self._sign_tools_cached = self._locate_sign_tools()
+        return self._sign_tools_cached
+    
+    def _log_not_found(self, message: str) -> None:
+        """Log a SignTools-not-found error followed by where it was searched for."""
+        self.log(message, "ERROR")
+        for line in _NOT_FOUND_MSG:
+            self.log(line, "ERROR")
+    
+    @staticmethod
+    def _is_exec(path: Path) -> bool:
+        """Check with a single stat() whether path is an executable regular file."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and bool(st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+    
+    def _sign_tools_candidates(self) -> Iterator[Path]:
+        """Yield possible SignTools executable locations in search order."""
         # Try explicitly set path first (from config or argument)
         if self.sign_tools_path:
-            if self.sign_tools_path.exists() and os.access(self.sign_tools_path, os.X_OK):
-                return self.sign_tools_path
-            else:
-                self.log(f"Warning: Specified SignTools path does not exist or is not executable: {self.sign_tools_path}", "WARN")
+            yield self.sign_tools_path
+            # Only reached if the path above was rejected
+            self.log(f"Warning: Specified SignTools path does not exist or is not executable: {self.sign_tools_path}", "WARN")
         
         # Try environment variable
         if os.environ.get("SIGNTOOLS_PATH"):
             sign_tools_path = Path(os.environ["SIGNTOOLS_PATH"]).expanduser().resolve()
-            if sign_tools_path.exists() and os.access(sign_tools_path, os.X_OK):
-                return sign_tools_path
-            else:
-                self.log(f"Warning: SIGNTOOLS_PATH environment variable points to invalid path: {sign_tools_path}", "WARN")
+            yield sign_tools_path
+            self.log(f"Warning: SIGNTOOLS_PATH environment variable points to invalid path: {sign_tools_path}", "WARN")
         
         # Try relative to script directory
         script_dir = Path(__file__).parent.resolve()
-        candidates = [
-            script_dir / "SignTools",
-            script_dir / "SignTools.app" / "Contents" / "MacOS" / "SignTools.bin",
-            script_dir / "SignTools.app" / "Contents" / "MacOS" / "SignTools",
-        ]
-        
-        for candidate in candidates:
-            if candidate.exists() and os.access(candidate, os.X_OK):
-                return candidate
+        yield from (script_dir / name for name in SIGN_TOOLS_NAMES)
         
         # Try parent directory (project root) if script is in a subdirectory
-        parent_dir = script_dir.parent
-        candidates = [
-            parent_dir / "SignTools",
-            parent_dir / "SignTools.app" / "Contents" / "MacOS" / "SignTools.bin",
-            parent_dir / "SignTools.app" / "Contents" / "MacOS" / "SignTools",
-        ]
-        
-        for candidate in candidates:
-            if candidate.exists() and os.access(candidate, os.X_OK):
-                return candidate
+        yield from (script_dir.parent / name for name in SIGN_TOOLS_NAMES)
         
         # Try searching up the directory tree for project root (look for signer-cfg.yml or go.mod)
         current = script_dir
         for _ in range(5):  # Search up to 5 levels
-            candidates = [
-                current / "SignTools",
-                current / "SignTools.app" / "Contents" / "MacOS" / "SignTools.bin",
-                current / "SignTools.app" / "Contents" / "MacOS" / "SignTools",
-            ]
             # Check if this looks like the project root (has signer-cfg.yml or go.mod)
             if (current / "signer-cfg.yml").exists() or (current / "go.mod").exists():
-                for candidate in candidates:
-                    if candidate.exists() and os.access(candidate, os.X_OK):
-                        return candidate
+                yield from (current / name for name in SIGN_TOOLS_NAMES)
             current = current.parent
         
         # Try in PATH
         which_result = shutil.which("SignTools")
         if which_result:
-            return Path(which_result)
+            yield Path(which_result)
         
         # Try in current working directory
         cwd = Path.cwd()
-        candidates = [
-            cwd / "SignTools",
-            cwd / "SignTools.app" / "Contents" / "MacOS" / "SignTools.bin",
-            cwd / "SignTools.app" / "Contents" / "MacOS" / "SignTools",
-        ]
+        yield from (cwd / name for name in SIGN_TOOLS_NAMES)
+    
+    def _locate_sign_tools(self) -> Optional[Path]:
+        """Search for the SignTools executable."""
+        return next((c for c in self._sign_tools_candidates() if self._is_exec(c)), None)
+    
+    @staticmethod
+    def _file_key(st: os.stat_result) -> FileKey:
+        """Identify a file by device and inode, which stay the same across renames."""
+        return (st.st_dev, st.st_ino)
+    
+    def _is_processed(self, key: FileKey) -> bool:
+        """Check whether a file is already being processed, refreshing its LRU position."""
+        with self._processed_lock:
+            if key in self.processed_files:
+                self.processed_files.move_to_end(key)
+                return True
+            return False
+    
+    def _claim(self, ipa_path: Path, key: Optional[FileKey] = None) -> Optional[Path]:
+        """Mark an IPA file as being processed. ipa_path must already be resolved.
+        Returns the path, or None if it is already being processed or no longer exists."""
+        assert ipa_path.is_absolute(), f"expected a resolved path: {ipa_path}"
+        abs_ipa_path = ipa_path
+        
+        if key is None:
+            try:
+                key = self._file_key(abs_ipa_path.stat())
+            except OSError:
+                return None
         
-        for candidate in candidates:
-            if candidate.exists() and os.access(candidate, os.X_OK):
-                return candidate
+        with self._processed_lock:
+            if key in self.processed_files:
+                self.processed_files.move_to_end(key)
+                return None
+            
+            self.processed_files[key] = abs_ipa_path
+            if len(self.processed_files) > MAX_PROCESSED:
+                self.processed_files.popitem(last=False)
+        return abs_ipa_path
+    
+    def _release(self, abs_path: Path, key: Optional[FileKey] = None) -> None:
+        """Remove a file from processed_files so it can be picked up again."""
+        if key is None:
+            try:
+                key = self._file_key(abs_path.stat())
+            except OSError:
+                pass
         
-        return None
+        with self._processed_lock:
+            if key is not None and self.processed_files.get(key) == abs_path:
+                del self.processed_files[key]
+                return
+            # The file is gone (or was replaced), fall back to searching by path
+            for k, p in self.processed_files.items():
+                if p == abs_path:
+                    del self.processed_files[k]
+                    return
     
-    def sign_ipa(self, ipa_path: Path) -> bool:
-        """Sign an IPA file using the CLI mode."""
-        # Resolve to absolute path for consistency
-        abs_ipa_path = ipa_path.resolve()
+    def submit_ipa(self, ipa_path: Path, key: Optional[FileKey] = None) -> bool:
+        """Queue an IPA file for signing. Queued files are dispatched by flush_batch()."""
+        abs_ipa_path = self._claim(ipa_path, key)
+        if not abs_ipa_path:
+            return False
+        
+        self._batch.append(abs_ipa_path)
+        return True
+    
+    def flush_batch(self) -> None:
+        """Dispatch all queued IPA files as SignTools batches.
+        Files are spread over as many batches as there are workers, with at most batch_size files each.
+        Runs synchronously if the worker pool has not been started."""
+        if not self._batch:
+            return
         
-        if abs_ipa_path in self.processed_files:
+        pending, self._batch = self._batch, []
+        num_batches = max(-(-len(pending) // self.batch_size), min(self.max_workers, len(pending)))
+        for i in range(num_batches):
+            batch = pending[i::num_batches]
+            if self._executor:
+                future = self._executor.submit(self._sign_batch, batch)
+                future.add_done_callback(functools.partial(self._batch_done, batch))
+            else:
+                self._sign_batch(batch)
+    
+    def _batch_done(self, batch: List[Path], future: "Future[int]") -> None:
+        """Log an exception that escaped a signing worker and release its files so they can be retried."""
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is None:
+            return
+        self.log(f"Unexpected error signing {', '.join(p.name for p in batch)}: {e}", "ERROR")
+        for abs_ipa_path in batch:
+            self._release(abs_ipa_path)
+    
+    def sign_ipa(self, ipa_path: Path) -> bool:
+        """Sign an IPA file using the CLI mode. ipa_path must already be resolved."""
+        abs_ipa_path = self._claim(ipa_path)
+        if not abs_ipa_path:
             return False
         
-        self.log(f"Processing: {ipa_path.name}")
-        self.processed_files.add(abs_ipa_path)
+        return self._sign_claimed(abs_ipa_path)
+    
+    def _sign_claimed(self, abs_ipa_path: Path) -> bool:
+        """Sign an IPA file that has already been claimed by _claim()."""
+        self.log(f"Processing: {abs_ipa_path.name}")
         
         # Generate output filename (use resolved path for consistency)
         output_name = abs_ipa_path.stem + "_signed.ipa"
@@ -158,25 +470,12 @@ class WatchFolderSigner:
         # Find SignTools executable
         sign_tools = self.find_sign_tools()
         if not sign_tools:
-            self.log(f"Error: SignTools executable not found", "ERROR")
-            self.log("Searched in:", "ERROR")
-            self.log("  1. Explicitly specified path (config/argument)", "ERROR")
-            self.log("  2. SIGNTOOLS_PATH environment variable", "ERROR")
-            self.log("  3. Script directory", "ERROR")
-            self.log("  4. Parent directory (project root)", "ERROR")
-            self.log("  5. Project root (detected by signer-cfg.yml or go.mod)", "ERROR")
-            self.log("  6. PATH environment variable", "ERROR")
-            self.log("  7. Current working directory", "ERROR")
-            self.log("", "ERROR")
-            self.log("Please specify the path using one of the following methods:", "ERROR")
-            self.log("  - Set SIGNTOOLS_PATH environment variable", "ERROR")
-            self.log("  - Add 'sign_tools_path' to config file", "ERROR")
-            self.log("  - Use --sign-tools-path argument", "ERROR")
+            self._log_not_found("Error: SignTools executable not found")
             # Move to failed folder if specified, otherwise remove from processed_files
             if self.failed_folder:
                 self.move_file(abs_ipa_path, self.failed_folder)
             else:
-                self.processed_files.discard(abs_ipa_path)
+                self._release(abs_ipa_path)
             return False
         
         # Build command
@@ -197,14 +496,9 @@ class WatchFolderSigner:
         # Execute signing
         try:
             self.log(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minutes timeout
-            )
+            returncode, tail = self._run_streamed(cmd, SIGN_TIMEOUT, abs_ipa_path.name)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log(f"Successfully signed: {output_path.name}")
                 # Move to processed folder if specified
                 if self.processed_folder:
@@ -212,44 +506,257 @@ class WatchFolderSigner:
                 else:
                     # If no processed folder, just remove from processed_files
                     # File remains in watch folder but won't be reprocessed
-                    self.processed_files.discard(abs_ipa_path)
+                    self._release(abs_ipa_path)
                 return True
+            elif self._interrupted(returncode):
+                self.log(f"Signing interrupted for {abs_ipa_path.name}, leaving it in the watch folder", "WARN")
+                self._release(abs_ipa_path)
+                return False
             else:
-                self.log(f"Signing failed for {ipa_path.name}: {result.stderr}", "ERROR")
-                self.log(f"Output: {result.stdout}", "ERROR")
+                self.log(f"Signing failed for {abs_ipa_path.name} (exit code {returncode})", "ERROR")
+                self.log("Last output:\n" + "\n".join(tail), "ERROR")
                 # Move to failed folder if specified, otherwise remove from processed_files
                 if self.failed_folder:
                     self.move_file(abs_ipa_path, self.failed_folder)
                 else:
-                    self.processed_files.discard(abs_ipa_path)
+                    self._release(abs_ipa_path)
                 return False
                 
+        except FileNotFoundError as e:
+            # SignTools was moved or deleted, search for it again next time
+            self._sign_tools_cached = None
+            self.log(f"Error signing {abs_ipa_path.name}: {e}", "ERROR")
+            if self.failed_folder:
+                self.move_file(abs_ipa_path, self.failed_folder)
+            else:
+                self._release(abs_ipa_path)
+            return False
         except subprocess.TimeoutExpired:
-            self.log(f"Signing timed out for {ipa_path.name}", "ERROR")
+            self.log(f"Signing timed out for {abs_ipa_path.name}", "ERROR")
             # Move to failed folder if specified, otherwise remove from processed_files
             if self.failed_folder:
                 self.move_file(abs_ipa_path, self.failed_folder)
             else:
-                self.processed_files.discard(abs_ipa_path)
+                self._release(abs_ipa_path)
             return False
         except Exception as e:
-            self.log(f"Error signing {ipa_path.name}: {e}", "ERROR")
+            self.log(f"Error signing {abs_ipa_path.name}: {e}", "ERROR")
             # Move to failed folder if specified, otherwise remove from processed_files
             if self.failed_folder:
                 self.move_file(abs_ipa_path, self.failed_folder)
             else:
-                self.processed_files.discard(abs_ipa_path)
+                self._release(abs_ipa_path)
             return False
     
+    def _sign_batch(self, abs_ipa_paths: List[Path]) -> int:
+        """Sign several claimed IPA files with a single SignTools invocation (-ipa-list).
+        Returns the number of files signed successfully."""
+        if len(abs_ipa_paths) == 1:
+            return int(self._sign_claimed(abs_ipa_paths[0]))
+        
+        self.log(f"Processing batch of {len(abs_ipa_paths)} files: {', '.join(p.name for p in abs_ipa_paths)}")
+        
+        sign_tools = self.find_sign_tools()
+        if not sign_tools:
+            self._log_not_found("Error: SignTools executable not found")
+            for abs_ipa_path in abs_ipa_paths:
+                self._finish_ipa(abs_ipa_path, False)
+            return 0
+        
+        # Pass the paths through a list file so the command line stays short regardless of batch size
+        list_path = ""
+        try:
+            # Written as raw file system bytes so names that are not valid UTF-8 survive the round trip
+            with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+                list_path = f.name
+                f.write(b"\n".join(os.fsencode(p) for p in abs_ipa_paths) + b"\n")
+        except OSError as e:
+            # e.g. no space left in the temp directory; single-file signing needs no list file
+            self.log(f"Failed to write the IPA list for batch signing ({e}), signing files one at a time", "WARN")
+            if list_path:
+                os.unlink(list_path)
+            return self._sign_each(abs_ipa_paths)
+        
+        cmd = [
+            str(sign_tools),
+            "-headless",
+            "-ipa-list", list_path,
+            "-profile", self.profile,
+            "-output-dir", str(self.output_folder),
+        ]
+        
+        if self.sign_args:
+            cmd.extend(["-args", self.sign_args])
+        
+        if self.bundle_id:
+            cmd.extend(["-bundle-id", self.bundle_id])
+        
+        # SignTools prints one "signed|failed<TAB>ipa<TAB>detail" line per file
+        results: Dict[str, Tuple[bool, str]] = {}
+        
+        def collect_result(line: str) -> None:
+            parts = line.split("\t", 2)
+            if len(parts) == 3 and parts[0] in ("signed", "failed"):
+                results[parts[1]] = (parts[0] == "signed", parts[2])
+        
+        try:
+            self.log(f"Running: {' '.join(cmd)}")
+            returncode, tail = self._run_streamed(
+                cmd, SIGN_TIMEOUT * len(abs_ipa_paths), "batch", on_line=collect_result
+            )
+        except FileNotFoundError as e:
+            # SignTools was moved or deleted, search for it again next time
+            self._sign_tools_cached = None
+            self.log(f"Error signing batch: {e}", "ERROR")
+            for abs_ipa_path in abs_ipa_paths:
+                self._finish_ipa(abs_ipa_path, False)
+            return 0
+        except subprocess.TimeoutExpired:
+            self.log(f"Signing timed out for batch of {len(abs_ipa_paths)} files", "ERROR")
+            for abs_ipa_path in abs_ipa_paths:
+                self._finish_ipa(abs_ipa_path, False)
+            return 0
+        except Exception as e:
+            self.log(f"Error signing batch: {e}", "ERROR")
+            for abs_ipa_path in abs_ipa_paths:
+                self._finish_ipa(abs_ipa_path, False)
+            return 0
+        finally:
+            os.unlink(list_path)
+        
+        if self._interrupted(returncode):
+            # Keep what was signed before the interruption; everything else stays in the watch folder
+            self.log(f"Batch signing interrupted (exit code {returncode}), leaving unsigned files in the watch folder", "WARN")
+            signed = 0
+            for abs_ipa_path in abs_ipa_paths:
+                success, detail = results.get(self._result_key(abs_ipa_path), (False, ""))
+                if success:
+                    self.log(f"Successfully signed: {Path(detail).name}")
+                    self._finish_ipa(abs_ipa_path, True)
+                    signed += 1
+                else:
+                    self._release(abs_ipa_path)
+            return signed
+        
+        if not results and returncode != 0:
+            if returncode == 2 and any(UNKNOWN_IPA_LIST_FLAG in line for line in tail):
+                # Older SignTools builds do not support -ipa-list
+                self.log("SignTools does not support -ipa-list, falling back to signing files one at a time", "WARN")
+                return self._sign_each(abs_ipa_paths)
+            self.log(f"Batch signing failed (exit code {returncode})", "ERROR")
+            self.log("Last output:\n" + "\n".join(tail), "ERROR")
+        
+        signed = 0
+        for abs_ipa_path in abs_ipa_paths:
+            success, detail = results.get(self._result_key(abs_ipa_path), (False, "no result reported by SignTools"))
+            if success:
+                self.log(f"Successfully signed: {Path(detail).name}")
+                signed += 1
+            else:
+                self.log(f"Signing failed for {abs_ipa_path.name}: {detail}", "ERROR")
+            self._finish_ipa(abs_ipa_path, success)
+        return signed
+    
+    @staticmethod
+    def _result_key(abs_ipa_path: Path) -> str:
+        """The path as it appears in a decoded SignTools result line (see _run_streamed())."""
+        return os.fsencode(abs_ipa_path).decode("utf-8", "replace")
+    
+    def _sign_each(self, abs_ipa_paths: List[Path]) -> int:
+        """Sign claimed files with one SignTools run each. Once run() is stopping, the remaining files
+        are released and left in the watch folder. Returns the number of files signed successfully."""
+        signed = 0
+        for abs_ipa_path in abs_ipa_paths:
+            if self._stopping:
+                self._release(abs_ipa_path)
+            else:
+                signed += self._sign_claimed(abs_ipa_path)
+        return signed
+    
+    def _interrupted(self, returncode: int) -> bool:
+        """Whether a SignTools run that exited with returncode was cut short by Ctrl+C or shutdown
+        rather than failing on its own."""
+        return returncode != 0 and (self._stopping or returncode in INTERRUPTED_RETURNCODES)
+    
+    def _run_streamed(
+        self,
+        cmd: List[str],
+        timeout: float,
+        label: str,
+        on_line: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[int, List[str]]:
+        """Run a command and log its combined stdout/stderr line by line as it is produced.
+        Only the last OUTPUT_TAIL_LINES lines are kept. Returns (exit code, last lines of output).
+        Raises subprocess.TimeoutExpired if the command runs for longer than timeout seconds."""
+        tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        deadline = time.monotonic() + timeout
+        
+        def handle_line(raw: bytes) -> None:
+            line = raw.decode("utf-8", "replace").rstrip("\r")
+            tail.append(line)
+            self.log(f"[{label}] {line}")
+            if on_line:
+                on_line(line)
+        
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+            with self._running_lock:
+                self._running.add(proc)
+            try:
+                def stop() -> NoReturn:
+                    proc.terminate()
+                    try:
+                        proc.wait(KILL_GRACE_PERIOD)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        proc.wait()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                
+                # Read with select() so the deadline is enforced even while SignTools is silent,
+                # and so a child process that keeps the pipe open cannot block us after a timeout
+                assert proc.stdout is not None
+                fd = proc.stdout.fileno()
+                buf = b""
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        stop()
+                    if not select.select([fd], [], [], remaining)[0]:
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    *lines, buf = (buf + chunk).split(b"\n")
+                    for raw in lines:
+                        handle_line(raw)
+                if buf:
+                    handle_line(buf)
+                
+                try:
+                    returncode = proc.wait(max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    stop()
+            finally:
+                with self._running_lock:
+                    self._running.discard(proc)
+        
+        return returncode, list(tail)
+    
+    def _finish_ipa(self, abs_ipa_path: Path, success: bool) -> None:
+        """Move a signed IPA to the processed folder or a failed one to the failed folder.
+        Without the matching folder the file stays in place and is released from processed_files."""
+        self.move_file(abs_ipa_path, self.processed_folder if success else self.failed_folder)
+    
     def move_file(self, file_path: Path, dest_folder: Optional[Path]) -> bool:
         """Move a file to a destination folder, or delete if dest_folder is None.
         Returns True if file was moved/deleted successfully, False otherwise.
-        Note: file_path should already be resolved to absolute path."""
+        Note: file_path must already be resolved to absolute path."""
+        assert file_path.is_absolute(), f"expected a resolved path: {file_path}"
+        abs_file_path = file_path
+        
         if not dest_folder:
             # If no destination folder specified, file remains in watch folder
             # Remove from processed_files so it can be retried
-            abs_file_path = file_path.resolve()
-            self.processed_files.discard(abs_file_path)
+            self._release(abs_file_path)
             return True
         
         # Ensure destination folder exists
@@ -260,88 +767,222 @@ class WatchFolderSigner:
             return False
         
         try:
-            # Resolve file path to absolute path before moving (if not already resolved)
-            abs_file_path = file_path.resolve()
-            
-            # Check if file still exists
-            if not abs_file_path.exists():
-                self.log(f"File no longer exists: {abs_file_path.name}", "WARN")
-                self.processed_files.discard(abs_file_path)
-                return True
+            # Identify the file before it leaves the watch folder
+            key = self._file_key(abs_file_path.stat())
             
-            dest_path = dest_folder / abs_file_path.name
-            # If file exists, add timestamp
-            if dest_path.exists():
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                dest_path = dest_folder / f"{abs_file_path.stem}_{timestamp}{abs_file_path.suffix}"
+            # A nanosecond suffix keeps names unique without checking the destination first,
+            # so concurrent workers cannot race each other for the same name
+            dest_path = dest_folder / f"{abs_file_path.stem}_{time.time_ns()}{abs_file_path.suffix}"
             
-            shutil.move(str(abs_file_path), str(dest_path))
-            self.log(f"Moved {abs_file_path.name} to {dest_folder}")
+            try:
+                # Atomic rename when both folders are on the same filesystem
+                os.replace(abs_file_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(abs_file_path), str(dest_path))
+            self.log(f"Moved {abs_file_path.name} to {dest_path}")
             # Remove from processed_files after successful move
-            self.processed_files.discard(abs_file_path)
+            self._release(abs_file_path, key)
             return True
         except FileNotFoundError:
-            abs_file_path = file_path.resolve()
             self.log(f"File not found (may have been deleted): {abs_file_path.name}", "WARN")
-            self.processed_files.discard(abs_file_path)
+            self._release(abs_file_path)
             return True
         except Exception as e:
-            abs_file_path = file_path.resolve()
             self.log(f"Failed to move {abs_file_path.name}: {e}", "ERROR")
             # If move failed, remove from processed_files so it can be retried
-            self.processed_files.discard(abs_file_path)
+            self._release(abs_file_path)
             return False
     
-    def scan_and_process(self):
+    def scan_and_process(self) -> None:
         """Scan the watch folder for new IPA files and process them."""
         if not self.watch_folder.exists():
             self.log(f"Watch folder does not exist: {self.watch_folder}", "ERROR")
             return
         
-        # Find all .ipa files in the watch folder and resolve to absolute paths
-        ipa_files = [f.resolve() for f in self.watch_folder.glob("*.ipa") if f.is_file()]
+        # Find all .ipa files in the watch folder and stat them relative to one directory fd.
+        # DirEntry caches the file type from the directory listing, so regular files are not
+        # stat'ed again while listing.
+        try:
+            dir_fd = os.open(self.watch_folder, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError as e:
+            self.log(f"Failed to scan watch folder {self.watch_folder}: {e}", "ERROR")
+            return
+        
+        try:
+            with os.scandir(dir_fd) as entries:
+                ipa_entries = [
+                    (entry.name, entry.is_symlink())
+                    for entry in entries
+                    if entry.name.endswith(".ipa") and entry.is_file()
+                ]
+            stats = self._stat_names(dir_fd, [name for name, _ in ipa_entries])
+        except OSError as e:
+            self.log(f"Failed to scan watch folder {self.watch_folder}: {e}", "ERROR")
+            return
+        finally:
+            os.close(dir_fd)
         
         # Filter out already processed files and files that are still being written
-        for ipa_file in ipa_files:
+        pending_stats: Dict[Path, StatKey] = {}
+        for (name, is_symlink), file_stat in zip(ipa_entries, stats):
+            if file_stat is None:
+                # File may have been deleted or moved, skip
+                continue
+            file_key, stat_key = file_stat
+            
+            # The watch folder is already resolved, so only symlinks need resolving
+            ipa_file = self.watch_folder / name
+            if is_symlink:
+                ipa_file = ipa_file.resolve()
+            
             # Skip if already processed
-            if ipa_file in self.processed_files:
+            if self._is_processed(file_key):
+                continue
+            
+            # A file is stable once its size and mtime are unchanged since the previous scan
+            if self._pending_stats.get(ipa_file) != stat_key:
+                # New or still being written, check again on the next scan
+                pending_stats[ipa_file] = stat_key
                 continue
             
-            # Check if file is still being written (wait a bit for file to stabilize)
+            # Queue the file for signing
+            self.submit_ipa(ipa_file, file_key)
+        
+        # Only remember files that are still present and unclaimed
+        self._pending_stats = pending_stats
+        self.flush_batch()
+    
+    def _stat_names(self, dir_fd: int, names: List[str]) -> List[Optional[Tuple[FileKey, StatKey]]]:
+        """Stat files relative to dir_fd, in one io_uring batch when available.
+        Returns ((dev, ino), (size, mtime)) per name, or None for files that could not be stat'ed."""
+        if self._statx and names:
+            return self._statx.stat(dir_fd, names)
+        
+        results: List[Optional[Tuple[FileKey, StatKey]]] = []
+        for name in names:
             try:
-                file_size_before = ipa_file.stat().st_size
-                time.sleep(0.5)
-                file_size_after = ipa_file.stat().st_size
+                st = os.stat(name, dir_fd=dir_fd)
+            except OSError:
+                results.append(None)
+                continue
+            results.append((self._file_key(st), (st.st_size, st.st_mtime_ns)))
+        return results
+    
+    def _run_polling(self) -> None:
+        """Watch the folder by rescanning it every poll_interval seconds."""
+        while True:
+            self.scan_and_process()
+            time.sleep(self.poll_interval)
+    
+    def _run_inotify(self) -> None:
+        """Watch the folder using inotify (Linux only).
+        IN_CLOSE_WRITE/IN_MOVED_TO fire once the file is complete, so no stability check is needed."""
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        
+        try:
+            wd = libc.inotify_add_watch(
+                fd, os.fsencode(self.watch_folder), IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE_SELF
+            )
+            if wd < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err))
+            
+            self.log("Using inotify to watch for new files")
+            # Pick up files that were already present before the watch was added
+            self.scan_and_process()
+            
+            # Files found by a scan have no pending event; rescan them every poll_interval until they are
+            # stable, on a deadline so that a steady stream of unrelated events cannot postpone the rescan
+            rescan_at: Optional[float] = None
+            while True:
+                if not self._pending_stats:
+                    rescan_at = None
+                elif rescan_at is None:
+                    rescan_at = time.monotonic() + self.poll_interval
                 
-                if file_size_before != file_size_after:
-                    # File is still being written, skip for now
+                timeout = max(0.0, rescan_at - time.monotonic()) if rescan_at is not None else None
+                ready = select.select([fd], [], [], timeout)[0]
+                if rescan_at is not None and time.monotonic() >= rescan_at:
+                    rescan_at = None
+                    self.scan_and_process()
+                if not ready:
                     continue
-            except (OSError, FileNotFoundError):
-                # File may have been deleted or moved, skip
-                continue
+                
+                buf = os.read(fd, 4096)
+                offset = 0
+                watch_removed = False
+                while offset < len(buf):
+                    _, mask, _, name_len = INOTIFY_EVENT_HEADER.unpack_from(buf, offset)
+                    offset += INOTIFY_EVENT_HEADER.size
+                    name = os.fsdecode(buf[offset:offset + name_len].rstrip(b"\0"))
+                    offset += name_len
+                    
+                    if mask & IN_Q_OVERFLOW:
+                        # Events were dropped, rescan so no file is missed
+                        self.log("inotify event queue overflowed, rescanning watch folder", "WARN")
+                        self.scan_and_process()
+                    elif mask & (IN_IGNORED | IN_DELETE_SELF):
+                        watch_removed = True
+                    elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and name.endswith(".ipa"):
+                        self.submit_ipa(self.watch_folder / name)
+                
+                if watch_removed:
+                    break
+                
+                # Dispatch once the burst of events has been drained
+                if not select.select([fd], [], [], 0)[0]:
+                    self.flush_batch()
+        finally:
+            os.close(fd)
+        
+        # The watch folder was removed or unmounted; polling reports it and resumes once it is back
+        self.log(f"Watch folder removed or unmounted: {self.watch_folder}, falling back to polling", "ERROR")
+        self._run_polling()
+    
+    def _run_watchdog(self) -> None:
+        """Watch the folder using watchdog's native observer (FSEvents on macOS).
+        These backends have no reliable close-after-write event, so every change triggers a scan and
+        files go through the same stability check as in polling mode."""
+        changed = threading.Event()
+        observer = Observer()
+        observer.schedule(IpaEventHandler(changed), str(self.watch_folder), recursive=False)
+        observer.start()
+        
+        try:
+            self.log(f"Using {type(observer).__name__} to watch for new files")
+            self.scan_and_process()
             
-            # Process the file
-            self.sign_ipa(ipa_file)
+            while True:
+                # Rescan every poll_interval only while files are waiting to become stable
+                changed.wait(self.poll_interval if self._pending_stats else None)
+                changed.clear()
+                self.scan_and_process()
+        finally:
+            observer.stop()
+            observer.join()
     
-    def run(self):
+    def _terminate_running(self) -> None:
+        """Terminate all SignTools processes started by worker threads."""
+        with self._running_lock:
+            running = list(self._running)
+        for proc in running:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
+    
+    def run(self) -> None:
         """Start watching the folder."""
         # Verify SignTools is found at startup
         sign_tools = self.find_sign_tools()
         if not sign_tools:
-            self.log("Error: SignTools executable not found at startup", "ERROR")
-            self.log("Searched in:", "ERROR")
-            self.log("  1. Explicitly specified path (config/argument)", "ERROR")
-            self.log("  2. SIGNTOOLS_PATH environment variable", "ERROR")
-            self.log("  3. Script directory", "ERROR")
-            self.log("  4. Parent directory (project root)", "ERROR")
-            self.log("  5. Project root (detected by signer-cfg.yml or go.mod)", "ERROR")
-            self.log("  6. PATH environment variable", "ERROR")
-            self.log("  7. Current working directory", "ERROR")
-            self.log("", "ERROR")
-            self.log("Please specify the path using one of the following methods:", "ERROR")
-            self.log("  - Set SIGNTOOLS_PATH environment variable", "ERROR")
-            self.log("  - Add 'sign_tools_path' to config file", "ERROR")
-            self.log("  - Use --sign-tools-path argument", "ERROR")
+            self._log_not_found("Error: SignTools executable not found at startup")
             raise RuntimeError("SignTools executable not found")
         
         self.log(f"Starting Watch Folder Signer")
@@ -351,35 +992,90 @@ class WatchFolderSigner:
         self.log(f"Profile: {self.profile}")
         self.log(f"Sign args: {self.sign_args or '(none)'}")
         self.log(f"Poll interval: {self.poll_interval} seconds")
+        self.log(f"Max workers: {self.max_workers}")
+        self.log(f"Batch size: {self.batch_size}")
         self.log("Press Ctrl+C to stop")
         self.log("")
         
+        if liburing and sys.platform.startswith("linux"):
+            try:
+                self._statx = StatxBatch(sqpoll=self.sqpoll)
+                if self._statx.sqpoll:
+                    self.log("Using io_uring with SQPOLL to batch file stats")
+                else:
+                    if self.sqpoll:
+                        self.log("SQPOLL not permitted, using a regular io_uring", "WARN")
+                    self.log("Using io_uring to batch file stats")
+            except Exception as e:
+                self.log(f"io_uring unavailable ({e}), using stat()", "WARN")
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
         try:
-            while True:
-                self.scan_and_process()
-                time.sleep(self.poll_interval)
+            if self.force_polling:
+                self._run_polling()
+            elif sys.platform.startswith("linux"):
+                try:
+                    self._run_inotify()
+                except OSError as e:
+                    self.log(f"inotify unavailable ({e}), falling back to polling", "WARN")
+                    self._run_polling()
+            elif Observer:
+                self._run_watchdog()
+            else:
+                self.log("watchdog is not installed, using polling (pip3 install watchdog)")
+                self._run_polling()
         except KeyboardInterrupt:
             self.log("Stopped by user")
         except Exception as e:
             self.log(f"Unexpected error: {e}", "ERROR")
             raise
+        finally:
+            # Drop queued jobs and wait for running SignTools processes. A terminal Ctrl+C has already
+            # interrupted them through the process group; their files are left in the watch folder
+            self._stopping = True
+            try:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            except KeyboardInterrupt:
+                # Ctrl+C again while waiting: stop the running SignTools processes instead
+                self.log("Interrupted again, terminating running signing jobs", "WARN")
+                self._terminate_running()
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            if self._statx:
+                self._statx.close()
+                self._statx = None
+            self.close_log()
+
 
+# Parsed config files by path, with the st_mtime_ns they were parsed at
+_config_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
 
-def load_config(config_file: str) -> Dict:
-    """Load configuration from a JSON file."""
+
+def load_config(config_file: str) -> Dict[str, Any]:
+    """Load configuration from a JSON file.
+    The parsed result is cached and only re-read when the file's modification time changes."""
     config_path = Path(config_file).expanduser().resolve()
-    if not config_path.exists():
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
         return {}
     
+    cached = _config_cache.get(config_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(config_path, "rb") as f:
+            config: Dict[str, Any] = _json_loads(f.read())
     except Exception as e:
         print(f"Error loading config file: {e}")
         return {}
+    
+    _config_cache[config_path] = (mtime_ns, config)
+    return config
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(
         description="Watch Folder Script for LocalSignTools - Automatically signs IPA files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -435,6 +1131,26 @@ Examples:
         default=2.0,
         help="Polling interval in seconds (default: 2.0)"
     )
+    parser.add_argument(
+        "-j", "--max-workers",
+        type=int,
+        help="Maximum number of IPA files signed in parallel (default: min(4, CPU count))"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Maximum number of IPA files passed to one SignTools run (default: 10, 1 disables batching)"
+    )
+    parser.add_argument(
+        "--force-polling",
+        action="store_true",
+        help="Always poll the watch folder instead of using file system events (e.g. for network mounts)"
+    )
+    parser.add_argument(
+        "--sqpoll",
+        action="store_true",
+        help="Submit batched stats through an io_uring SQPOLL kernel thread (Linux with liburing only)"
+    )
     parser.add_argument(
         "-c", "--config",
         help="Configuration file (JSON format, overrides command line arguments)"
@@ -462,10 +1178,18 @@ Examples:
     log_file = args.log_file or config.get("log_file")
     poll_interval = args.poll_interval or config.get("poll_interval", 2.0)
     sign_tools_path = args.sign_tools_path or config.get("sign_tools_path")
+    max_workers = args.max_workers if args.max_workers is not None else config.get("max_workers")
+    batch_size = args.batch_size if args.batch_size is not None else config.get("batch_size")
+    force_polling = args.force_polling or config.get("force_polling", False)
+    sqpoll = args.sqpoll or config.get("sqpoll", False)
     
     # Validate required arguments
     if not watch_folder or not output_folder or not profile:
         parser.error("watch_folder, output_folder, and profile are required (use -w, -o, -p or -c config file)")
+    if max_workers is not None and max_workers < 1:
+        parser.error("max_workers must be at least 1")
+    if batch_size is not None and batch_size < 1:
+        parser.error("batch_size must be at least 1")
     
     # Create and run the watch folder signer
     signer = WatchFolderSigner(
@@ -479,10 +1203,31 @@ Examples:
         log_file=log_file,
         poll_interval=poll_interval,
         sign_tools_path=sign_tools_path,
+        max_workers=max_workers,
+        batch_size=batch_size,
+        force_polling=force_polling,
+        sqpoll=sqpoll,
     )
     
     signer.run()
 
 
+def _compiled_main() -> Optional[Callable[[], None]]:
+    """Return main() from the mypyc-compiled module (see setup.py) if it has been built next to this script.
+    A build older than this file is ignored so that edits to watch_folder.py are never shadowed by a stale .so."""
+    spec = importlib.util.find_spec("watch_folder")
+    if not (spec and spec.origin and spec.origin.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))):
+        return None
+    try:
+        stale = os.stat(spec.origin).st_mtime_ns < os.stat(__file__).st_mtime_ns
+    except OSError:
+        stale = True
+    if stale:
+        print(f"Ignoring compiled module older than {__file__}: {spec.origin} (rebuild with setup.py)", file=sys.stderr)
+        return None
+    compiled_main: Callable[[], None] = importlib.import_module("watch_folder").main
+    return compiled_main
+
+
 if __name__ == "__main__":
-    main()
+    (_compiled_main() or main)()